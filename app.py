@@ -1,8 +1,10 @@
-import pygame as pg
-
+from src.lazy_import import lazy_import
 from src.map import Map
 from src.player import Player
 
+# pygame is only imported when the game starts
+pg = lazy_import("pygame")
+
 
 
 class Main_game:
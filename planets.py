@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+from time import perf_counter
+
+# used by the startup report to measure the time taken by the imports
+STARTUP_TIME = perf_counter()
+
 import pygame as pg
+import numpy as np # pygame already imports numpy (pygame.surfarray) so this costs nothing more
 
 from typing import *
 from pygame.gfxdraw import filled_polygon
 from math import sqrt
 from random import randint
 from time import time
+from functools import cache
+from contextlib import contextmanager
+
+import os
+import re
+import sys
+
+IMPORT_DURATION = perf_counter() - STARTUP_TIME
 
 # color constants
 BLACK = ( 0, 0, 0)
@@ -16,6 +30,50 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 DARKBLUE = (24, 43, 102)
 
+# block type ids used in the block type array of the planets
+NO_BLOCK = -1 # cells without any block (center of the planet)
+AIR, GRASS, DIRT, STONE, SAND, GRAVEL, WATER = range(7)
+BLOCK_NAMES = ("air", "grass", "dirt", "stone", "sand", "gravel", "water")
+
+# density of each block type, a falling block can only move into a cell of lower density
+BLOCK_DENSITIES = (0, 3, 3, 3, 2, 2, 1)
+
+# number of cellular simulation ticks per second (independent of the FPS)
+SIMULATION_RATE = 20
+SIMULATION_TIMESTEP = 1 / SIMULATION_RATE
+# maximum number of ticks per frame so that a lag spike doesn't make the game freeze
+MAX_SIMULATION_STEPS = 5
+# number of cells water can flow along a layer after falling before it settles
+WATER_FLOW_DISTANCE = 8
+
+# keys to select the block placed by the player
+PLACEABLE_BLOCKS = {pg.K_1: STONE, pg.K_2: DIRT, pg.K_3: GRASS, pg.K_4: SAND, pg.K_5: GRAVEL, pg.K_6: WATER}
+
+# used to calculate gravity
+GRAVITATIONAL_CONSTANT = 6.67*10**-11
+
+# particles
+MAX_PARTICLES = 10000
+PARTICLE_SIZE = 4
+PARTICLE_SPEED = 8
+PARTICLE_LIFETIME = 1.2 # in seconds
+PARTICLE_DRAG = 0.95
+# number of particles created when breaking and placing a block
+BREAK_PARTICLES = 40
+PLACE_PARTICLES = 15
+
+# animations
+DIRECTIONS = ("up", "down", "left", "right")
+ANIMATION_SPEED = 8 # frames per second
+# rotated animation frames are cached for this many angles
+ANGLE_BUCKETS = 64
+MAX_ROTATED_FRAMES = 512
+PLAYER_SIZE = (200, 200)
+
+# startup
+STARTUP_TARGET = 0.5 # maximum time in seconds before the first frame is shown
+LOADING_FRAME_BUDGET = 1/30 # time in seconds spent loading between two frames of the loading screen
+
 # height of the bloc on the planet (the width is automatically calculated accordingly)
 BLOCK_SIZE = 90
 
@@ -74,7 +132,7 @@ class Block:
 
 
 class Planet:
-    def __init__(self, name:str, position:tuple[int, int], mass:float, num_layers:int, num_blocks_per_layer:int=-1, center_size:float=-1) -> None:
+    def __init__(self, name:str, position:tuple[int, int], mass:float, num_layers:int, num_blocks_per_layer:int=-1, center_size:float=-1, generate:bool=True) -> None:
         """Class for generating planets
 
         Args:
@@ -84,6 +142,7 @@ class Planet:
             num_layers (int): number of layers
             num_blocks_per_layer (int): number of blocks per layer, leave -1 for automatic values
             center_size (float): size of the center of the planet, leave -1 for automatic values
+            generate (bool): generate the planet right away, leave False to generate it later with generate() (ex: during a loading screen)
         """
         self.name = name
         
@@ -123,13 +182,28 @@ class Planet:
         self.block_rendering_surf = pg.Surface((sqrt(self.block_height**2 + self.block_height**2), sqrt(self.block_height**2 + self.block_height**2)))
         self.block_rendering_surf.set_colorkey(BLACK)
 
-        self.air_image = pg.image.load(r"graphics\blocks\air\air.png").convert_alpha()
-        self.grass_image = pg.image.load(r"graphics\blocks\grass\grass.png").convert_alpha()
-        self.dirt_image = pg.image.load(r"graphics\blocks\dirt\dirt.png").convert_alpha()
-        self.stone_image = pg.image.load(r"graphics\blocks\stone\stone.png").convert_alpha()
-        
-        # procedural generation of the planet
-        self.blocks = self.generate_blocks()
+        self.air_image = load_image(r"graphics\blocks\air\air.png")
+        self.grass_image = load_image(r"graphics\blocks\grass\grass.png")
+        self.dirt_image = load_image(r"graphics\blocks\dirt\dirt.png")
+        self.stone_image = load_image(r"graphics\blocks\stone\stone.png")
+        self.sand_image = load_image(r"graphics\blocks\sand\sand.png")
+        self.gravel_image = load_image(r"graphics\blocks\gravel\gravel.png")
+        self.water_image = load_image(r"graphics\blocks\water\water.png")
+
+        # images of each block type id (see constants at the top) and the other way around
+        self.block_images = [self.air_image, self.grass_image, self.dirt_image, self.stone_image, self.sand_image, self.gravel_image, self.water_image]
+        self.block_ids = {image: block_id for block_id, image in enumerate(self.block_images)}
+        # average color of each block type (used for particles and the minimap)
+        self.block_colors = [pg.transform.average_color(image) for image in self.block_images]
+
+        # cells that might move during the next simulation tick
+        # settled cells are not in this set so a planet full of settled terrain costs nothing to simulate
+        self.active_cells = set()
+        self.simulation_time = 0
+
+        # procedural generation of the planet (blocks, block type array and minimap)
+        if generate:
+            self.regenerate()
 
     def generate_block(self, x:int, y:int, block_type:pg.Surface) -> Block:
         """Generate block object for coordinates (x, y) on a planet.
@@ -170,49 +244,154 @@ class Planet:
         block = Block(x, y, [a, b, c, d], block_type)
         return block
 
-    def generate_blocks(self) -> List[Block]:
-        """ Procedurally generates the blocks of the planet.
+    def generate_layer(self, y:int) -> List[Block]:
+        """ Procedurally generates the blocks of one layer of the planet.
         Blocks generate clockwise starting up.
 
+        Args:
+            y (int): layer to generate
+
         Returns:
-            List[Block]: generated blocks
+            List[Block]: generated blocks (empty for the center of the planet)
         """
         blocks = []
-        
+
         # start generating blocks after the center
         start_layer = self.center_size // self.block_height
 
-        for y in range(self.max_y):
-            for x in range(self.max_x):
-                if y >= 1:
-                    
-                    # stone
-                    if start_layer < y < self.max_y - 14:
-                        block = self.generate_block(x, y, self.stone_image)
+        for x in range(self.max_x):
+            if y >= 1:
+                
+                # stone
+                if start_layer < y < self.max_y - 14:
+                    block = self.generate_block(x, y, self.stone_image)
 
-                    # dirt
-                    elif self.max_y - 14 <= y < self.max_y - 11:
-                        block = self.generate_block(x, y, self.dirt_image)
-                    
-                    # grass
-                    elif self.max_y - 11 <= y < self.max_y - 10:
-                        block = self.generate_block(x, y, self.grass_image)
+                # dirt
+                elif self.max_y - 14 <= y < self.max_y - 11:
+                    block = self.generate_block(x, y, self.dirt_image)
+                
+                # grass
+                elif self.max_y - 11 <= y < self.max_y - 10:
+                    block = self.generate_block(x, y, self.grass_image)
 
-                    # air
-                    elif self.max_y - 10 <= y <= self.max_y:
-                        block = self.generate_block(x, y, self.air_image)
-                    
-                    else:
-                        block = None
+                # air
+                elif self.max_y - 10 <= y <= self.max_y:
+                    block = self.generate_block(x, y, self.air_image)
+                
+                else:
+                    block = None
 
-                    blocks.append(block)
+                blocks.append(block)
 
         return blocks
 
+    def generate(self) -> Iterator[float]:
+        """ Procedurally generates the planet one layer at a time so that the game can keep drawing (ex: loading screen) in between.
+
+        Yields:
+            float: progress of the generation between 0 and 1
+        """
+        blocks = []
+
+        for y in range(self.max_y):
+            blocks += self.generate_layer(y)
+            yield (y+1) / (self.max_y+1)
+
+        self.blocks = blocks
+        self.block_types = self.generate_block_types()
+        self.minimap = self.generate_minimap()
+        self.active_cells = set()
+
+        # direction (-1, 1 or 0 if it hasn't flowed yet) and remaining flow distance of the water in each cell
+        self.flow_directions = np.zeros_like(self.block_types)
+        self.flow_distances = np.full_like(self.block_types, WATER_FLOW_DISTANCE)
+
+        yield 1
+
+    def generate_block_types(self) -> np.ndarray:
+        """ Build the array of block type ids from the blocks of the planet.
+        It is indexed [y, x] and cells without a block are NO_BLOCK.
+
+        Returns:
+            np.ndarray: block type ids of the planet
+        """
+        block_types = np.full((self.max_y, self.max_x), NO_BLOCK, dtype=np.int8)
+
+        for block in self.blocks:
+            if block != None:
+                block_types[block.y, block.x] = self.block_ids[block.block_type]
+
+        return block_types
+
+    def generate_minimap(self) -> pg.Surface:
+        """ Generate the minimap of the planet, one pixel per block colored by block type.
+        Pixels outside of the planet and air are transparent.
+
+        Returns:
+            pg.Surface: minimap of the planet
+        """
+        size = 2*(self.max_y - 1)
+
+        # offset of each pixel from the center of the planet (in blocks)
+        pixel_x, pixel_y = np.meshgrid(np.arange(size) - size/2 + 0.5, np.arange(size) - size/2 + 0.5, indexing="ij") # surfarray is indexed [x, y]
+
+        # coordinates of the block under each pixel, blocks generate clockwise starting up and layer y is between radius y-1 and y
+        block_y = np.floor(np.hypot(pixel_x, pixel_y)).astype(np.int32) + 1
+        block_x = (np.degrees(np.arctan2(pixel_x, -pixel_y)) % 360 * self.max_x / 360).astype(np.int32) % self.max_x
+
+        self.minimap_inside = block_y < self.max_y
+        self.minimap_block_x = np.where(self.minimap_inside, block_x, 0)
+        self.minimap_block_y = np.where(self.minimap_inside, block_y, 0)
+
+        # pixels of each block sorted by block so that set_block can find them quickly
+        block_indices = (self.minimap_block_x + (self.minimap_block_y-1)*self.max_x).ravel()
+        block_indices[~self.minimap_inside.ravel()] = -1
+        self.minimap_pixel_order = np.argsort(block_indices, kind="stable")
+        self.minimap_sorted_blocks = block_indices[self.minimap_pixel_order]
+
+        # color of each block type, air is transparent and the last color is used for cells without block (NO_BLOCK = -1)
+        self.minimap_colors = np.array([BLACK] + [color[:3] for color in self.block_colors[1:]] + [BLUE], dtype=np.uint8)
+
+        pixels = self.minimap_colors[self.block_types[self.minimap_block_y, self.minimap_block_x]]
+        pixels[~self.minimap_inside] = BLACK
+
+        minimap = pg.Surface((size, size))
+        pg.surfarray.blit_array(minimap, pixels)
+        minimap.set_colorkey(BLACK)
+
+        return minimap
+
+    def update_minimap(self, xs:np.ndarray, ys:np.ndarray) -> None:
+        """ Change the color of the pixels of blocks on the minimap
+
+        Args:
+            xs (np.ndarray): x coordinates of the blocks in planet coordinates
+            ys (np.ndarray): y coordinates of the blocks in planet coordinates
+        """
+        block_indices = xs + (ys-1)*self.max_x
+
+        starts = np.searchsorted(self.minimap_sorted_blocks, block_indices, side="left")
+        ends = np.searchsorted(self.minimap_sorted_blocks, block_indices, side="right")
+        counts = ends - starts
+
+        if counts.sum() == 0:
+            return
+
+        # index in minimap_pixel_order of every pixel of the blocks, and the block each pixel belongs to
+        pixel_blocks = np.repeat(np.arange(len(block_indices)), counts)
+        pixel_positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + starts[pixel_blocks]
+        pixels = self.minimap_pixel_order[pixel_positions]
+
+        size = self.minimap.get_height()
+        minimap_pixels = pg.surfarray.pixels3d(self.minimap)
+        minimap_pixels[pixels // size, pixels % size] = self.minimap_colors[self.block_types[ys, xs]][pixel_blocks]
+        del minimap_pixels # unlock the surface
+
     def regenerate(self) -> None:
         """Regenerate the planet procedurally (=reset the planet)
         """
-        self.blocks = self.generate_blocks(self)
+        for _ in self.generate():
+            pass
 
     def set_block(self, coords:tuple[int, int], block_type:pg.Surface) -> None:
         """Changes block type at coordinates.
@@ -224,7 +403,42 @@ class Planet:
             coords (tuple[int, int]): coordinates of the block in planet coordinates
             block_type (pg.Surface): block type to change to
         """
-        self.blocks[coords[0] + (coords[1]-1)*self.num_blocks_per_layer].block_type = block_type
+        self.block_types[coords[1], coords[0]] = self.block_ids[block_type]
+
+        # water placed by the player can flow again
+        self.flow_directions[coords[1], coords[0]] = 0
+        self.flow_distances[coords[1], coords[0]] = WATER_FLOW_DISTANCE
+
+        self.update_blocks(np.array([coords[0]]), np.array([coords[1]]))
+
+    def update_blocks(self, xs:np.ndarray, ys:np.ndarray) -> None:
+        """ Update everything that depends on the block type array after blocks were changed in it
+        (block objects, minimap and active cells of the simulation)
+
+        Args:
+            xs (np.ndarray): x coordinates of the changed blocks in planet coordinates
+            ys (np.ndarray): y coordinates of the changed blocks in planet coordinates
+        """
+        for index, block_type in zip((xs + (ys-1)*self.num_blocks_per_layer).tolist(), self.block_types[ys, xs].tolist()):
+            self.blocks[index].block_type = self.block_images[block_type]
+
+        self.update_minimap(xs, ys)
+
+        # the changed blocks and the ones above them might start falling
+        self.wake_cells(xs, ys)
+
+    def wake_cells(self, xs:np.ndarray, ys:np.ndarray) -> None:
+        """ Add cells and the cells that could fall into them to the active cells of the simulation
+
+        Args:
+            xs (np.ndarray): x coordinates of the cells in planet coordinates
+            ys (np.ndarray): y coordinates of the cells in planet coordinates
+        """
+        for dy in (0, 1):
+            inside = (1 <= ys + dy) & (ys + dy < self.max_y)
+
+            for dx in (-1, 0, 1):
+                self.active_cells.update(zip(((xs[inside] + dx) % self.max_x).tolist(), (ys[inside] + dy).tolist()))
 
     def get_block(self, coords:tuple[int, int]) -> Block:
         """ Get the block type at coordinates on the planet
@@ -264,8 +478,120 @@ class Planet:
         # blit the block on the screen with offset
         screen.blit(self.block_rendering_surf, block.bounding_box.topleft - player_pos + CALIBRATION_VECTOR)
 
-    def update(self) -> None:
-        pass
+    def simulate(self) -> None:
+        """ Run one tick of the cellular simulation (falling sand and gravel, flowing water).
+
+        Only the active cells are processed, all of them at once with numpy.
+        Cells that can't move are settled and removed from the active cells until a block next to them changes.
+        """
+        if not self.active_cells:
+            return
+
+        cells = np.array(list(self.active_cells))
+        self.active_cells = set()
+
+        xs, ys = cells[:, 0], cells[:, 1]
+        types = self.block_types[ys, xs]
+
+        # only keep the cells that can fall
+        falling = np.isin(types, (SAND, GRAVEL, WATER))
+        xs, ys, types = xs[falling], ys[falling], types[falling]
+
+        if len(types) == 0:
+            return
+
+        densities = np.array(BLOCK_DENSITIES)
+        block_densities = densities[types]
+
+        # random direction for each cell so that piles spread evenly on both sides
+        side = np.random.choice((-1, 1), len(types))
+
+        # water that can't fall flows along its layer, always in the same direction and for a limited distance
+        # so that it settles instead of moving back and forth forever
+        flow_directions = self.flow_directions[ys, xs]
+        flow_directions = np.where(flow_directions != 0, flow_directions, side)
+        can_flow = (types == WATER) & (self.flow_distances[ys, xs] > 0)
+
+        # possible moves by order of priority: down, diagonally down (not gravel), sideways (only water)
+        moves = [(0, -1, np.ones(len(types), dtype=bool)),
+                 (side, -1, types != GRAVEL),
+                 (-side, -1, types != GRAVEL),
+                 (flow_directions, 0, can_flow)]
+
+        target_xs = np.full(len(types), -1)
+        target_ys = np.full(len(types), -1)
+
+        for dx, dy, allowed in moves:
+            candidate_xs = (xs + dx) % self.max_x # the planet wraps around
+            candidate_ys = ys + dy
+
+            valid = (target_xs == -1) & allowed & self.can_move_into(candidate_xs, candidate_ys, block_densities)
+
+            target_xs[valid] = candidate_xs[valid]
+            target_ys[valid] = candidate_ys[valid]
+
+        movers = np.flatnonzero(target_xs != -1)
+        np.random.shuffle(movers)
+
+        source_indices = ys[movers] * self.max_x + xs[movers]
+        target_indices = target_ys[movers] * self.max_x + target_xs[movers]
+
+        # a cell can only receive one block per tick and can't receive one if its own block is moving
+        _, first = np.unique(target_indices, return_index=True)
+        first = first[~np.isin(target_indices[first], source_indices)]
+        winners = movers[first]
+
+        # cells which lost a conflict try again next tick
+        losers = np.setdiff1d(movers, winners)
+        self.active_cells.update(zip(xs[losers].tolist(), ys[losers].tolist()))
+
+        if len(winners) == 0:
+            return
+
+        # swap the moving blocks with the blocks they move into, all at once
+        changed_xs = np.concatenate((xs[winners], target_xs[winners]))
+        changed_ys = np.concatenate((ys[winners], target_ys[winners]))
+        swapped_xs = np.concatenate((target_xs[winners], xs[winners]))
+        swapped_ys = np.concatenate((target_ys[winners], ys[winners]))
+
+        for cells in (self.block_types, self.flow_directions, self.flow_distances):
+            cells[changed_ys, changed_xs] = cells[swapped_ys, swapped_xs]
+
+        # water that flowed keeps its direction and can flow less far, water that fell can flow again
+        flowed = target_ys[winners] == ys[winners]
+        self.flow_directions[target_ys[winners], target_xs[winners]] = np.where(flowed, flow_directions[winners], 0)
+        self.flow_distances[target_ys[winners], target_xs[winners]] = np.where(flowed, self.flow_distances[target_ys[winners], target_xs[winners]] - 1, WATER_FLOW_DISTANCE)
+
+        self.update_blocks(changed_xs, changed_ys)
+
+    def can_move_into(self, xs:np.ndarray, ys:np.ndarray, densities:np.ndarray) -> np.ndarray:
+        """ Check which cells blocks of given densities can move into
+
+        Args:
+            xs (np.ndarray): x coordinates of the cells in planet coordinates
+            ys (np.ndarray): y coordinates of the cells in planet coordinates
+            densities (np.ndarray): densities of the moving blocks
+
+        Returns:
+            np.ndarray: True for each cell which has a block of lower density
+        """
+        # layer 0 is the center of the planet so there is nothing to move into
+        cell_types = self.block_types[np.maximum(ys, 0), xs]
+
+        return (ys >= 1) & (cell_types != NO_BLOCK) & (np.array(BLOCK_DENSITIES)[cell_types] < densities)
+
+    def update(self, delta_time:float) -> None:
+        """ Update the planet
+
+        Args:
+            delta_time (float): time between two frames
+        """
+        # run the simulation at a fixed rate regardless of FPS
+        self.simulation_time = min(self.simulation_time + delta_time, MAX_SIMULATION_STEPS * SIMULATION_TIMESTEP)
+
+        while self.simulation_time >= SIMULATION_TIMESTEP:
+            self.simulate()
+            self.simulation_time -= SIMULATION_TIMESTEP
         
     def draw(self, screen:pg.Surface, player:Player) -> None:
         """ Draw the planet on the screen based on player position
@@ -302,14 +628,211 @@ class Planet:
         return num_blocks_being_displayed
 
 
-class Player(pg.sprite.Sprite):
-    def __init__(self, position:tuple[float, float]) -> None:
+class Animation_frames:
+    def __init__(self, folder:str, name:str, size:tuple[int, int]) -> None:
+        """ Loads and scales all the animation frames of a character once, and caches their rotated versions.
+        Share one object between all the entities using the same sprites.
+
+        Frames are expected at folder/status/name_direction_status/name_direction_statusN.png
+        (ex: graphics/player/walk/player_down_walk/player_down_walk1.png)
+
+        Args:
+            folder (str): folder of the character sprites
+            name (str): name of the character in the file names
+            size (tuple[int, int]): size of the frames once scaled
+        """
+        self.size = size
+
+        # list of frames for each (status, direction)
+        self.animations = {}
+
+        walk_sequence = read_walk_animation_info(os.path.join(folder, "walk", "walk_animation_info.txt"))
+
+        for direction in DIRECTIONS:
+            idle_frames = self.load_frames(folder, name, "idle", direction)
+            walk_frames = self.load_frames(folder, name, "walk", direction)
+
+            self.animations[("idle", direction)] = idle_frames
+
+            # the walk animation also uses idle frames, see walk_animation_info.txt
+            if walk_sequence and walk_frames:
+                self.animations[("walk", direction)] = [(walk_frames if status == "walk" else idle_frames)[index] for status, index in walk_sequence]
+            else:
+                self.animations[("walk", direction)] = walk_frames or idle_frames
+
+        # rotated frames for each (frame, angle bucket)
+        self.rotated_frames = {}
+
+    def load_frames(self, folder:str, name:str, status:str, direction:str) -> List[pg.Surface]:
+        """ Load and scale the frames of one animation
+
+        Args:
+            folder (str): folder of the character sprites
+            name (str): name of the character in the file names
+            status (str): status of the animation (idle or walk)
+            direction (str): direction of the animation (up, down, left or right)
+
+        Returns:
+            List[pg.Surface]: scaled frames of the animation
+        """
+        frames = []
+        animation_name = f"{name}_{direction}_{status}"
+
+        while os.path.isfile(path := os.path.join(folder, status, animation_name, f"{animation_name}{len(frames)+1}.png")):
+            frames.append(pg.transform.scale(load_image(path), self.size))
+
+        return frames
+
+    def get_num_frames(self, status:str, direction:str) -> int:
+        """ Get the number of frames of an animation
+
+        Args:
+            status (str): status of the animation (idle or walk)
+            direction (str): direction of the animation (up, down, left or right)
+
+        Returns:
+            int: number of frames
+        """
+        return len(self.animations[(status, direction)])
+
+    def get_frame(self, status:str, direction:str, frame_index:int, angle:float=0) -> pg.Surface:
+        """ Get a frame rotated by an angle.
+        The angle is rounded to the closest of ANGLE_BUCKETS angles so each rotated frame is only computed once.
+
+        Args:
+            status (str): status of the animation (idle or walk)
+            direction (str): direction of the animation (up, down, left or right)
+            frame_index (int): index of the frame in the animation
+            angle (float): counterclockwise angle in degrees
+
+        Returns:
+            pg.Surface: rotated frame
+        """
+        frames = self.animations[(status, direction)]
+        frame_index = int(frame_index) % len(frames)
+        bucket = round(angle * ANGLE_BUCKETS / 360) % ANGLE_BUCKETS
+
+        if bucket == 0:
+            return frames[frame_index]
+
+        # frames used several times in an animation are only rotated once
+        key = (frames[frame_index], bucket)
+
+        if key not in self.rotated_frames:
+            # forget the oldest rotated frame so that the cache doesn't grow forever
+            if len(self.rotated_frames) >= MAX_ROTATED_FRAMES:
+                del self.rotated_frames[next(iter(self.rotated_frames))]
+
+            self.rotated_frames[key] = pg.transform.rotate(frames[frame_index], bucket * 360 / ANGLE_BUCKETS)
+
+        return self.rotated_frames[key]
+
+
+class Animated_sprite(pg.sprite.Sprite):
+    def __init__(self, position:tuple[float, float], animation_frames:Animation_frames) -> None:
+        """ Base class for animated entities (player, NPCs...)
+
+        Args:
+            position (tuple[float, float]): start position of the entity
+            animation_frames (Animation_frames): frames of the entity, can be shared with other entities
+        """
+        pg.sprite.Sprite.__init__(self)
+
+        self.animation_frames = animation_frames
+
+        # animation state
+        self.status = "idle"
+        self.direction = "down"
+        self.frame_index = 0
+
+        self.image = self.animation_frames.get_frame(self.status, self.direction, self.frame_index)
+        self.rect = self.image.get_rect(center = position)
+
+    def animate(self, delta_time:float) -> None:
+        """ Go forward in the current animation
+
+        Args:
+            delta_time (float): time between two frames
+        """
+        self.frame_index = (self.frame_index + ANIMATION_SPEED * delta_time) % self.animation_frames.get_num_frames(self.status, self.direction)
+
+    def get_image(self, angle:float=0) -> pg.Surface:
+        """ Get the current frame of the animation
+
+        Args:
+            angle (float): counterclockwise angle of the frame in degrees
+
+        Returns:
+            pg.Surface: current frame
+        """
+        return self.animation_frames.get_frame(self.status, self.direction, self.frame_index, angle)
+
+    def update(self, planets:List[Planet], delta_time:float) -> None:
+        """ Animate the entity and keep it standing up on the closest planet
+
+        Args:
+            planets (List[Planet]): list of all planets
+            delta_time (float): time between two frames
+        """
+        self.animate(delta_time)
+
+        # same as the player, the closest planet is the one pulling the strongest (F = G*m/d^2, G doesn't change which one)
+        closest_planet = max(planets, key=lambda planet: planet.mass / max(planet.position.distance_squared_to(self.rect.center), 0.00001))
+        angle_to_planet = -(self.rect.center-closest_planet.position).angle_to(pg.Vector2(0, -1))
+
+        self.image = self.get_image(-angle_to_planet)
+        self.rect = self.image.get_rect(center = self.rect.center)
+
+
+class Entity_group(pg.sprite.Group):
+    def draw(self, screen:pg.Surface, player:Player) -> None:
+        """ Draw the entities of the group inside the render distance with one blits call based on player position
+
+        Args:
+            screen (pg.Surface): screen to draw the entities on
+            player (Player): player
+        """
+        player_pos = pg.Vector2(player.rect.center)
+        offset = CALIBRATION_VECTOR - player_pos
+
+        visible_sprites = []
+
+        for sprite in self.sprites():
+            # check if the entity is inside the rotated screen, same as blocks, with a margin for the size of the entity
+            rotated_position = (pg.Vector2(sprite.rect.center) - player_pos).rotate(360 - player.get_angle_to_planet())
+            margin = max(sprite.rect.size) / 2
+
+            if abs(rotated_position.x) <= player.render_distance.x + margin and abs(rotated_position.y) <= player.render_distance.y + margin:
+                visible_sprites.append((sprite.image, sprite.rect.topleft + offset))
+
+        screen.blits(visible_sprites, doreturn=False)
+
+
+def read_walk_animation_info(path:str) -> List[tuple[str, int]]:
+    """ Read the order of the frames of the walk animation (see graphics/player/walk/walk_animation_info.txt)
+
+    Args:
+        path (str): path of the info file
+
+    Returns:
+        List[tuple[str, int]]: status and index of each frame of the walk animation, empty if there is no info file
+    """
+    if not os.path.isfile(path):
+        return []
+
+    with open(path) as file:
+        return [(status, int(number) - 1) for status, number in re.findall(r'"(walk|idle)(\d+)"', file.read())]
+
+
+class Player(Animated_sprite):
+    def __init__(self, position:tuple[float, float], animation_frames:Animation_frames) -> None:
         """ Player class
 
         Args:
             position (tuple[float, float]): start position of the player
+            animation_frames (Animation_frames): frames of the player
         """
-        pg.sprite.Sprite.__init__(self)
+        Animated_sprite.__init__(self, position, animation_frames)
 
         # vectors
         self.velocity = pg.Vector2(0, 0)
@@ -325,11 +848,6 @@ class Player(pg.sprite.Sprite):
         # render distance for the x and y directions
         self.render_distance = pg.Vector2(SCREENWIDTH/2 + BLOCK_SIZE, SCREENHEIGHT/2 + BLOCK_SIZE)
 
-        # sprite
-        self.image = pg.image.load(r"graphics\player\idle\player_down_idle\player_down_idle1.png").convert_alpha()
-        self.image = pg.transform.scale(self.image, (200, 200))
-
-        self.rect = self.image.get_rect(center = position)
         self.hitbox = self.rect.inflate(5, 5)
 
     def get_angle_to_planet(self) -> float:
@@ -364,7 +882,7 @@ class Player(pg.sprite.Sprite):
             if planet_dir != pg.Vector2(0, 0):
                 planet_dir = planet_dir.normalize()
 
-            force = 6.67*10**-11 * planet.mass / max(l, 0.00001) # F = G*m/d^2
+            force = GRAVITATIONAL_CONSTANT * planet.mass / max(l, 0.00001) # F = G*m/d^2
             planet_dir *= force
 
             # update closest planet variable
@@ -383,12 +901,18 @@ class Player(pg.sprite.Sprite):
         keys = pg.key.get_pressed()
         if keys[pg.K_d]:
             input_dir.x = 1
+            self.direction = "right"
         if keys[pg.K_q]:
             input_dir.x = -1
+            self.direction = "left"
         if keys[pg.K_s]:
             input_dir.y = 1
+            self.direction = "down"
         if keys[pg.K_z]:
             input_dir.y = -1
+            self.direction = "up"
+
+        self.status = "walk" if input_dir.length_squared() != 0 else "idle"
 
         if input_dir.length_squared() >= 1:
             input_dir = input_dir.normalize() * self.speed
@@ -413,7 +937,7 @@ class Player(pg.sprite.Sprite):
         self.velocity *= self.drag
 
         if self.velocity.length_squared() != 0:
-            self.velocity = self.velocity.clamp_magnitude(self.max_speed)
+            self.velocity = self.velocity.clamp_magnitude(self.max_velocity)
 
         # move player rect
         self.rect.center += self.velocity * delta_time * 50
@@ -429,19 +953,182 @@ class Player(pg.sprite.Sprite):
         self.gravity(planets) # apply gravity
         self.input() # handle inputs
         self.move(delta_time) # move the player
+        self.animate(delta_time) # go forward in the animation
 
         self.check_collision()
 
-    def draw(self, screen) -> None:
+    def draw(self, screen:pg.Surface, camera_angle:float) -> None:
         """ Draw the player sprite on the screen
 
         Args:
-            screen (_type_): screen to draw the player on
+            screen (pg.Surface): screen to draw the player on
+            camera_angle (float): current rotation of the screen
         """
+        # the camera is late on the rotation of the player so the player is rotated by the difference
+        self.image = self.get_image(camera_angle - self.get_angle_to_planet())
+
         # player is drawn on the center of the screen
         screen.blit(self.image, (SCREENWIDTH//2 - self.image.get_width()//2, SCREENHEIGHT//2 - self.image.get_height()//2))
 
 
+class Particle_system:
+    def __init__(self, max_particles:int=MAX_PARTICLES) -> None:
+        """ Class for handling particles (ex: when breaking blocks)
+
+        All the particles are stored in numpy arrays and updated at the same time instead of being one object each.
+        They are drawn by writing their pixels directly in the screen with numpy.
+
+        Args:
+            max_particles (int): maximum number of particles alive at the same time
+        """
+        self.max_particles = max_particles
+        self.num_particles = 0
+
+        self.positions = np.zeros((max_particles, 2))
+        self.velocities = np.zeros((max_particles, 2))
+        self.lifetimes = np.zeros(max_particles)
+        self.colors = np.zeros(max_particles, dtype=np.int32) # index of the color of each particle in self.palette
+
+        # colors used by particles
+        self.palette = []
+        self.color_ids = {}
+
+        # offsets of the pixels of a particle from its top left pixel, in pixels and lines of the screen
+        self.pixel_offsets = np.stack(np.meshgrid(np.arange(PARTICLE_SIZE), np.arange(PARTICLE_SIZE), indexing="ij"), axis=-1).reshape(-1, 2)
+
+    def get_color_id(self, color:tuple[int, int, int]) -> int:
+        """ Get the id of a color, adding it to the palette if it is the first time it is used
+
+        Args:
+            color (tuple[int, int, int]): color of the particles
+
+        Returns:
+            int: id of the color
+        """
+        color = tuple(color[:3])
+
+        if color not in self.color_ids:
+            self.color_ids[color] = len(self.palette)
+            self.palette.append(color)
+
+        return self.color_ids[color]
+
+    def emit(self, position:pg.Vector2, color:tuple[int, int, int], amount:int, speed:float=PARTICLE_SPEED, lifetime:float=PARTICLE_LIFETIME) -> None:
+        """ Create particles going in random directions from a position
+
+        Args:
+            position (pg.Vector2): position of the particles in world coordinates
+            color (tuple[int, int, int]): color of the particles
+            amount (int): number of particles to create
+            speed (float): maximum speed of the particles
+            lifetime (float): maximum lifetime of the particles in seconds
+        """
+        # don't create more particles than there is space for
+        amount = min(amount, self.max_particles - self.num_particles)
+        if amount <= 0:
+            return
+
+        start, end = self.num_particles, self.num_particles + amount
+
+        angles = np.random.uniform(0, 2*np.pi, amount)
+        speeds = np.random.uniform(0, speed, amount)
+
+        self.positions[start:end] = position
+        self.velocities[start:end, 0] = np.cos(angles) * speeds
+        self.velocities[start:end, 1] = np.sin(angles) * speeds
+        self.lifetimes[start:end] = np.random.uniform(lifetime/2, lifetime, amount)
+        self.colors[start:end] = self.get_color_id(color)
+
+        self.num_particles = end
+
+    def update(self, planets:List[Planet], delta_time:float) -> None:
+        """ Move the particles and remove the dead ones
+
+        Args:
+            planets (List[Planet]): list of all planets
+            delta_time (float): time between two frames
+        """
+        if self.num_particles == 0:
+            return
+
+        n = self.num_particles
+        positions = self.positions[:n]
+        velocities = self.velocities[:n]
+
+        # apply gravity of each planet to all particles at once, same as for the player
+        for planet in planets:
+            planet_dir = np.array(planet.position) - positions
+            l = np.maximum(np.einsum("ij,ij->i", planet_dir, planet_dir), 0.00001)
+
+            force = GRAVITATIONAL_CONSTANT * planet.mass / l # F = G*m/d^2
+            velocities += planet_dir * (force / np.sqrt(l))[:, None]
+
+        velocities *= PARTICLE_DRAG
+        positions += velocities * delta_time * 50
+
+        self.lifetimes[:n] -= delta_time
+
+        # move alive particles to the start of the arrays
+        alive = self.lifetimes[:n] > 0
+        num_alive = np.count_nonzero(alive)
+
+        if num_alive != n:
+            for array in (self.positions, self.velocities, self.lifetimes, self.colors):
+                array[:num_alive] = array[:n][alive]
+            self.num_particles = num_alive
+
+    def draw(self, screen:pg.Surface, player:Player) -> None:
+        """ Draw the particles on the screen based on player position
+
+        Args:
+            screen (pg.Surface): screen to draw the particles on
+            player (Player): player
+        """
+        if self.num_particles == 0:
+            return
+
+        # position of the particles on the screen
+        offset = np.array(CALIBRATION_VECTOR - pg.Vector2(player.rect.center)) - PARTICLE_SIZE/2
+        screen_positions = (self.positions[:self.num_particles] + offset).astype(np.int32)
+
+        # only draw particles entirely inside the screen
+        width, height = screen.get_size()
+        visible = (screen_positions[:, 0] >= 0) & (screen_positions[:, 0] <= width - PARTICLE_SIZE) & (screen_positions[:, 1] >= 0) & (screen_positions[:, 1] <= height - PARTICLE_SIZE)
+
+        if not visible.any():
+            return
+
+        # the pixels can only be written directly with 4 bytes per pixel, otherwise fill each particle
+        if screen.get_bytesize() != 4:
+            for color, position in zip(self.colors[:self.num_particles][visible].tolist(), screen_positions[visible].tolist()):
+                screen.fill(self.palette[color], (position, (PARTICLE_SIZE, PARTICLE_SIZE)))
+            return
+
+        # pixels of the screen as one flat array
+        pixels_per_line = screen.get_pitch() // 4
+        pixel_offsets = self.pixel_offsets[:, 0] + self.pixel_offsets[:, 1] * pixels_per_line
+
+        top_left_pixels = screen_positions[visible, 0] + screen_positions[visible, 1] * pixels_per_line
+        colors = np.array([screen.map_rgb(color) for color in self.palette], dtype=np.uint32)[self.colors[:self.num_particles][visible]]
+
+        # write every pixel of every visible particle at once
+        pixels = np.frombuffer(screen.get_buffer(), dtype=np.uint32)
+        pixels[(top_left_pixels[:, None] + pixel_offsets).ravel()] = np.repeat(colors, PARTICLE_SIZE**2)
+        del pixels # unlock the screen
+
+
+@cache
+def load_image(path:str) -> pg.Surface:
+    """ Load an image the first time it is needed, then return the same surface every time
+
+    Args:
+        path (str): path of the image
+
+    Returns:
+        pg.Surface: the image
+    """
+    return pg.image.load(path).convert_alpha()
+
 def blitRotate(surf:pg.Surface, image:pg.Surface, pivot_start:tuple[int, int], pivot_end:tuple[int, int], angle:float) -> None:
     """Rotates an image around a pivot and then blits it on the surf
 
@@ -480,21 +1167,75 @@ def get_closest_block_on_planet(coords:pg.Vector2, planet:Planet) -> None:
     return closest_block
 
 
-class Main_game:
+class Startup_timer:
     def __init__(self) -> None:
+        """ Class for measuring the time taken by each step of the startup (see --startup-report)
+        """
+        # time taken by each step in seconds
+        self.durations = {"imports": IMPORT_DURATION}
+
+        # time since the start of the program when the first frames are shown
+        self.first_frame_time = None
+        self.first_game_frame_time = None
+
+    @contextmanager
+    def measure(self, step:str) -> Iterator[None]:
+        """ Add the time taken by the code inside the with statement to a step
+
+        Args:
+            step (str): name of the step (ex: "assets")
+        """
+        start = perf_counter()
+        yield
+        self.add(step, perf_counter() - start)
+
+    def add(self, step:str, duration:float) -> None:
+        """ Add time to a step
+
+        Args:
+            step (str): name of the step (ex: "assets")
+            duration (float): time in seconds
+        """
+        self.durations[step] = self.durations.get(step, 0) + duration
+
+    def report(self) -> str:
+        """ Get the report of the startup
+
+        Returns:
+            str: time taken by each step and time before the first frames
+        """
+        lines = ["Startup report :"]
+        lines += [f"  {step:<16}{duration*1000:8.1f} ms" for step, duration in self.durations.items()]
+        lines.append(f"  {'first frame':<16}{self.first_frame_time*1000:8.1f} ms (target : {STARTUP_TARGET*1000:.0f} ms{', too slow' if self.first_frame_time > STARTUP_TARGET else ''})")
+        lines.append(f"  {'first game frame':<16}{self.first_game_frame_time*1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+class Main_game:
+    def __init__(self, startup_report:bool=False) -> None:
         """ Main game class
+
+        Only opens the window, the assets are loaded and the planets generated by load() while the loading screen is shown.
+
+        Args:
+            startup_report (bool): print the time taken by each step of the startup
         """
-        # initialize pygame
-        pg.init()
-        pg.font.init()
+        self.startup_timer = Startup_timer()
+        self.startup_report = startup_report
 
-        # initialize font
-        self.font = pg.font.SysFont('freesansbold', 30)
+        with self.startup_timer.measure("window"):
+            # initialize only the pygame modules used by the game
+            pg.display.init()
+            pg.font.init()
 
-        self.screen = pg.display.set_mode((SCREENWIDTH, SCREENHEIGHT))
-        self.internal_screen = pg.Surface((SCREEN_DIAGONAL_LENGTH, SCREEN_DIAGONAL_LENGTH))
-        
-        pg.display.set_caption("Planet Game")
+            # default pygame font (freesansbold), faster than searching the system fonts
+            self.font = pg.font.Font(None, 30)
+
+            self.screen = pg.display.set_mode((SCREENWIDTH, SCREENHEIGHT))
+            # 32 bits so that particles can be written directly in its pixels whatever the display format is
+            self.internal_screen = pg.Surface((SCREEN_DIAGONAL_LENGTH, SCREEN_DIAGONAL_LENGTH), depth=32)
+            
+            pg.display.set_caption("Planet Game")
 
         # initialize time
         self.clock = pg.time.Clock()
@@ -506,10 +1247,55 @@ class Main_game:
         self.current_angle = 0
         self.target_angle = 0
 
-        self.player = Player((1000, -3110))
+        self.selected_block = STONE # block placed with left click
+
+        self.show_map = False
+
+        # loading steps, see load()
+        self.loading = self.load()
+        self.loading_progress = 0
+
+    def load(self) -> Iterator[tuple[str, float]]:
+        """ Load the assets and generate the planets a little at a time so that the loading screen keeps being drawn
+
+        Yields:
+            tuple[str, float]: name of the step being loaded (for the startup report) and loading progress between 0 and 1
+        """
+        # frames are shared by every entity using the player sprites
+        self.player_frames = Animation_frames(os.path.join("graphics", "player"), "player", PLAYER_SIZE)
+        yield "assets", 0.1
+
+        # list of all planets, they are generated below
+        self.planets = [Planet("Planet 1", (1000, 500), 6*10**15, 50, generate=False)]
+        yield "assets", 0.15
+
+        for i, planet in enumerate(self.planets):
+            for progress in planet.generate():
+                yield "generation", 0.15 + 0.85 * (i + progress) / len(self.planets)
+
+        self.player = Player((1000, -3110), self.player_frames)
+
+        # animated entities other than the player (ex: NPCs)
+        self.entities = Entity_group()
 
-        # list of all planets
-        self.planets = [Planet("Planet 1", (1000, 500), 6*10**15, 50)]
+        self.particles = Particle_system()
+        yield "generation", 1
+
+    def draw_loading_screen(self) -> None:
+        """ Draw the loading screen with the loading progress
+        """
+        self.screen.fill(DARKBLUE)
+
+        text = self.font.render("Loading...", False, WHITE)
+        self.screen.blit(text, text.get_rect(center = HALF_SCREEN_VECTOR - (0, 30)))
+
+        # progress bar
+        bar = pg.Rect(0, 0, SCREENWIDTH//3, 20)
+        bar.center = HALF_SCREEN_VECTOR
+        pg.draw.rect(self.screen, WHITE, bar, 2)
+        pg.draw.rect(self.screen, WHITE, (bar.x, bar.y, bar.width * self.loading_progress, bar.height))
+
+        pg.display.flip()
 
     def update(self) -> None:
         """ Update the game
@@ -527,18 +1313,29 @@ class Main_game:
                     self.running = False
                 if event.key == pg.K_SPACE:
                     self.player.jump()
+                if event.key == pg.K_m:
+                    self.show_map = not self.show_map
+                if event.key in PLACEABLE_BLOCKS:
+                    self.selected_block = PLACEABLE_BLOCKS[event.key]
 
             if event.type == pg.MOUSEBUTTONDOWN:
                 # place block
                 if event.button == 1:
                     corrected_pos = (pg.Vector2(pg.mouse.get_pos()) - HALF_SCREEN_VECTOR).rotate(self.player.get_angle_to_planet()) + self.player.rect.center
                     touched_block = get_closest_block_on_planet(corrected_pos, self.player.closest_planet)
-                    self.player.closest_planet.set_block(touched_block.get_coords(), self.player.closest_planet.stone_image)
+                    self.player.closest_planet.set_block(touched_block.get_coords(), self.player.closest_planet.block_images[self.selected_block])
+
+                    self.particles.emit(touched_block.bounding_box.center, self.player.closest_planet.block_colors[self.selected_block], PLACE_PARTICLES)
 
                 # break block
                 if event.button == 3:
                     corrected_pos = (pg.Vector2(pg.mouse.get_pos()) - HALF_SCREEN_VECTOR).rotate(self.player.get_angle_to_planet()) + self.player.rect.center
                     touched_block = get_closest_block_on_planet(corrected_pos, self.player.closest_planet)
+
+                    # particles of the block being broken
+                    if touched_block.block_type != self.player.closest_planet.air_image:
+                        self.particles.emit(touched_block.bounding_box.center, self.player.closest_planet.block_colors[self.player.closest_planet.block_ids[touched_block.block_type]], BREAK_PARTICLES)
+
                     self.player.closest_planet.set_block(touched_block.get_coords(), self.player.closest_planet.air_image)
         
         # update player
@@ -546,11 +1343,35 @@ class Main_game:
 
         # update planets
         for planet in self.planets:
-            planet.update()
+            planet.update(self.delta_time)
+
+        # update entities
+        self.entities.update(self.planets, self.delta_time)
+
+        # update particles
+        self.particles.update(self.planets, self.delta_time)
 
     def draw(self) -> None:
         """ Draw everything on the screen
         """
+        # the map hides the world so the world isn't drawn at all while it is shown
+        if self.show_map:
+            self.draw_map()
+            num_blocks_being_displayed = 0
+        else:
+            num_blocks_being_displayed = self.draw_world()
+        
+        # UI
+        self.draw_ui(num_blocks_being_displayed)
+
+        pg.display.flip()
+
+    def draw_world(self) -> int:
+        """ Draw the planets, entities, particles and player with the rotating camera
+
+        Returns:
+            int: number of blocks drawn
+        """
         self.internal_screen.fill(DARKBLUE) # background
         
         num_blocks_being_displayed = 0
@@ -559,6 +1380,12 @@ class Main_game:
         for planet in self.planets:
             num_blocks_being_displayed += planet.draw(self.internal_screen, self.player)
 
+        # draw entities
+        self.entities.draw(self.internal_screen, self.player)
+
+        # draw particles
+        self.particles.draw(self.internal_screen, self.player)
+
         # rotate the screen so that the closest planet is always down
         self.target_angle = self.player.get_angle_to_planet()
 
@@ -580,9 +1407,16 @@ class Main_game:
                    self.current_angle)
 
         # draw player
-        self.player.draw(self.screen)
-        
-        # UI
+        self.player.draw(self.screen, self.current_angle)
+
+        return num_blocks_being_displayed
+
+    def draw_ui(self, num_blocks_being_displayed:int) -> None:
+        """ Draw the UI on top of the screen
+
+        Args:
+            num_blocks_being_displayed (int): number of blocks drawn this frame
+        """
         if round(self.clock.get_fps()) <= 30:
             self.screen.blit(self.font.render(f"FPS : {round(self.clock.get_fps())} (il faudrait optimiser ça)", False, RED), (20, 20))
         else:
@@ -595,20 +1429,76 @@ class Main_game:
         
         if closest_block != None:
             self.screen.blit(self.font.render(f"Coordinates on planet : {closest_block.get_coords()}", False, WHITE), (20, 90))
-        
-        pg.display.flip()
+
+        self.screen.blit(self.font.render(f"Selected block : {BLOCK_NAMES[self.selected_block]} (1-6)", False, WHITE), (20, 110))
+        self.screen.blit(self.font.render(f"Number of particles : {self.particles.num_particles}", False, WHITE), (20, 130))
+
+    def draw_map(self) -> None:
+        """ Draw the map of the planets around the player, one pixel per block
+        """
+        self.screen.fill(DARKBLUE)
+
+        player_pos = pg.Vector2(self.player.rect.center)
+
+        # the minimaps are already up to date so each planet is only one blit
+        for planet in self.planets:
+            map_position = (planet.position - player_pos) / BLOCK_SIZE + HALF_SCREEN_VECTOR
+            self.screen.blit(planet.minimap, planet.minimap.get_rect(center=map_position))
+
+        # the player is in the middle of the map
+        pg.draw.circle(self.screen, RED, HALF_SCREEN_VECTOR, 3)
+
+    def run_loading_screen(self) -> None:
+        """Loading screen loop, runs until everything is loaded
+        """
+        # show the loading screen before loading anything
+        self.draw_loading_screen()
+        self.startup_timer.first_frame_time = perf_counter() - STARTUP_TIME
+
+        while self.running and self.loading != None:
+            for event in pg.event.get():
+                if event.type == pg.QUIT:
+                    self.running = False
+
+            # load as much as possible without making the loading screen freeze
+            frame_start = perf_counter()
+
+            while self.loading != None and perf_counter() - frame_start < LOADING_FRAME_BUDGET:
+                step_start = perf_counter()
+                try:
+                    step, self.loading_progress = next(self.loading)
+                except StopIteration:
+                    self.loading = None
+                    break
+                self.startup_timer.add(step, perf_counter() - step_start)
+
+            self.draw_loading_screen()
+
+            self.clock.tick(60)
+
+        # start delta time from the end of the loading
+        self.current_time = time()
 
     def run(self) -> None:
         """Main game loop
         """
+        self.run_loading_screen()
+
         while self.running:
             self.update()
             self.draw()
             self.clock.tick(60)
 
+            if self.startup_timer.first_game_frame_time == None:
+                self.startup_timer.first_game_frame_time = perf_counter() - STARTUP_TIME
+
+                if self.startup_report:
+                    print(self.startup_timer.report())
+
         pg.quit()
 
 
 if __name__ == "__main__":
-    game = Main_game()
+    # run with --startup-report to see how long the game takes to start
+    game = Main_game(startup_report="--startup-report" in sys.argv)
     game.run()
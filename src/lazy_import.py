@@ -0,0 +1,29 @@
+import importlib.util
+import sys
+
+
+def lazy_import(name:str):
+    """ Import a module only when one of its attributes is used for the first time.
+    Use this for heavy modules so that they don't slow down the start of the game.
+
+    Args:
+        name (str): name of the module (ex: "numpy")
+
+    Returns:
+        module: the module, actually loaded on first attribute access
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
@@ -1,4 +1,7 @@
-import pygame
+from src.lazy_import import lazy_import
+
+# pygame is only imported when a player is created
+pygame = lazy_import("pygame")
 
 
 class Player:
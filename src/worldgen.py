@@ -1,15 +1,24 @@
 """Fichier Temporaire (ou pas) sur la génération procédurale de terrain et partie temporaire de visualisation des terrains générés"""
 
 import perlinNoise
-import matplotlib.pyplot as plt
-
-noise=perlinNoise.Perlin()
-x =[i*0.01 for i in range(1000)]
-y = [0 for i in range(1000)]
-for i in range(10):
-    j = [(noise.valueAt(k))/2**(2*i) *(-1)**i for k in x]
-    for h in range(len(y)):
-        y[h]+=(j[h])
-
-plt.plot(x,y)
-plt.show()
\ No newline at end of file
+
+
+def generate_terrain(num_points=1000, step=0.01, octaves=10):
+    """Génère une courbe de terrain en additionnant plusieurs octaves de bruit de Perlin"""
+    noise=perlinNoise.Perlin()
+    x =[i*step for i in range(num_points)]
+    y = [0 for i in range(num_points)]
+    for i in range(octaves):
+        j = [(noise.valueAt(k))/2**(2*i) *(-1)**i for k in x]
+        for h in range(len(y)):
+            y[h]+=(j[h])
+    return x, y
+
+
+if __name__ == "__main__":
+    # matplotlib est lent à importer, on ne l'importe que pour la visualisation
+    import matplotlib.pyplot as plt
+
+    x, y = generate_terrain()
+    plt.plot(x,y)
+    plt.show()